@@ -9,6 +9,7 @@ from .cplInfo import (
     get_subtitle_tracks,
     get_cpl_summary,
     process_cpl_file_to_json,
+    process_cpl_files_to_json,
     CPLInfo,
     MainImageVirtualTrack,
     MainAudioVirtualTrack,
@@ -1,12 +1,22 @@
-import xml.etree.ElementTree as et
-import re
+import functools
+import math
+import os
 import logging
 import json
 import typing
 from fractions import Fraction
 import hashlib
-import datetime
-import io
+import concurrent.futures
+
+try:
+    from lxml import etree as et
+except ImportError:
+    import xml.etree.ElementTree as et
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .labels import lookup_name
 
@@ -14,14 +24,39 @@ LOGGER = logging.getLogger(__name__)
 
 
 def split_qname(qname: str):
-    m = re.match(r'\{(.*)\}(.*)', qname)
-    return (m.group(1) if m else None, m.group(2) if m else None)
+    if qname.startswith("{"):
+        namespace, _, local_name = qname[1:].partition("}")
+        return (namespace, local_name)
+    return (None, qname)
 
 
+@functools.lru_cache(maxsize=64)
 def cpl_rational_to_fraction(r: str) -> Fraction:
     return Fraction(*map(int, r.split()))
 
 
+@functools.lru_cache(maxsize=128)
+def parse_rate(r: str) -> Fraction:
+    """Parses a RegXML rational (e.g. 24000/1001), caching the result since few distinct rates occur"""
+    return Fraction(r)
+
+
+def rational_to_str(numerator: int, denominator: int) -> str:
+    """Formats numerator/denominator like str(Fraction(numerator, denominator)) without creating a Fraction"""
+    gcd = math.gcd(numerator, denominator)
+    numerator //= gcd
+    denominator //= gcd
+    return str(numerator) if denominator == 1 else f"{numerator}/{denominator}"
+
+
+def milliseconds_to_str(milliseconds: int) -> str:
+    """Formats a duration as H:MM:SS.mmm"""
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+
 REGXML_NS = {
     "r0": "http://www.smpte-ra.org/reg/395/2014/13/1/aaf",
     "r1": "http://www.smpte-ra.org/reg/335/2012",
@@ -39,10 +74,61 @@ COMPATIBLE_CORE_NS = set((
     "http://www.smpte-ra.org/ns/2067-2/2020"
 ))
 
+# compiled XPath expressions are only available with lxml
+XPATH = getattr(et, "XPath", None)
+
+
+class CompiledPath:
+    """Path evaluated with a compiled XPath expression when lxml is available"""
+
+    __slots__ = ("path", "namespaces", "xpath")
+
+    def __init__(self, path: str, namespaces: typing.Dict[str, str], xpath: typing.Optional[typing.Callable]) -> None:
+        self.path = path
+        self.namespaces = namespaces
+        self.xpath = xpath
+
+    def __call__(self, element: et.Element) -> list:
+        # elements from xml.etree (e.g. passed to parse_cpl_element) cannot be evaluated by lxml
+        if self.xpath is not None and et.iselement(element):
+            return self.xpath(element)
+        return element.findall(self.path, self.namespaces)
+
+
+def compile_path(path: str, namespaces: typing.Dict[str, str]) -> CompiledPath:
+    """Compiles a path once so that it is not re-parsed on every evaluation"""
+    # ElementTree caches compiled paths internally, so there is nothing to compile without lxml
+    xpath = XPATH(path, namespaces=namespaces) if XPATH is not None else None
+    return CompiledPath(path, namespaces, xpath)
+
+
+def first_text(elements: list) -> typing.Optional[str]:
+    """Returns the text of the first element, with the same semantics as findtext()"""
+    return (elements[0].text or "") if elements else None
+
+
+# essence descriptor properties are children of the single descriptor element within EssenceDescriptor
+SAMPLE_RATE_PATH = compile_path("./*/r1:SampleRate", REGXML_NS)
+STORED_WIDTH_PATH = compile_path("./*/r1:StoredWidth", REGXML_NS)
+STORED_HEIGHT_PATH = compile_path("./*/r1:StoredHeight", REGXML_NS)
+PICTURE_COMPRESSION_PATH = compile_path("./*/r1:PictureCompression", REGXML_NS)
+CONTAINER_FORMAT_PATH = compile_path("./*/r1:ContainerFormat", REGXML_NS)
+TRANSFER_CHARACTERISTIC_PATH = compile_path("./*/r1:TransferCharacteristic", REGXML_NS)
+CODING_EQUATIONS_PATH = compile_path("./*/r1:CodingEquations", REGXML_NS)
+COLOR_PRIMARIES_PATH = compile_path("./*/r1:ColorPrimaries", REGXML_NS)
+SPOKEN_LANGUAGE_PATH = compile_path("./*/r1:SubDescriptors/*/r1:RFC5646SpokenLanguage", REGXML_NS)
+CHANNEL_SYMBOLS_PATH = compile_path("./*/r1:SubDescriptors/r0:AudioChannelLabelSubDescriptor/r1:MCATagSymbol", REGXML_NS)
+SOUNDFIELD_SYMBOL_PATH = compile_path("./*/r1:SubDescriptors/r0:SoundfieldGroupLabelSubDescriptor/r1:MCATagSymbol", REGXML_NS)
+CHANNEL_ASSIGNMENT_PATH = compile_path("./*/r1:ChannelAssignment", REGXML_NS)
+LANGUAGE_TAG_LIST_PATH = compile_path("./*/r2:RFC5646LanguageTagList", REGXML_NS)
 
 class MainImageVirtualTrack:
     """Image information"""
 
+    __slots__ = ("sample_rate", "stored_width", "stored_height", "picture_compression", "container_format",
+                 "transfer_characteristic", "coding_equations", "color_primaries", "fingerprint", "track_id",
+                 "duration", "resource_count")
+
     sample_rate: Fraction
     stored_width: int
     stored_height: int
@@ -50,15 +136,14 @@ class MainImageVirtualTrack:
 
     def __init__(self, descriptor_element: et.Element, fingerprint: str, track_id: str, duration: Fraction,
                  resource_count: int) -> None:
-        self.sample_rate = Fraction(descriptor_element.findtext(".//r1:SampleRate", namespaces=REGXML_NS))
-        self.stored_width = int(descriptor_element.findtext(".//r1:StoredWidth", namespaces=REGXML_NS))
-        self.stored_height = int(descriptor_element.findtext(".//r1:StoredHeight", namespaces=REGXML_NS))
-        self.picture_compression = str(descriptor_element.findtext(".//r1:PictureCompression", namespaces=REGXML_NS))
-        self.container_format = str(descriptor_element.findtext(".//r1:ContainerFormat", namespaces=REGXML_NS))
-        self.transfer_characteristic = str(
-            descriptor_element.findtext(".//r1:TransferCharacteristic", namespaces=REGXML_NS))
-        self.coding_equations = str(descriptor_element.findtext(".//r1:CodingEquations", namespaces=REGXML_NS))
-        self.color_primaries = str(descriptor_element.findtext(".//r1:ColorPrimaries", namespaces=REGXML_NS))
+        self.sample_rate = parse_rate(first_text(SAMPLE_RATE_PATH(descriptor_element)) or "0")
+        self.stored_width = int(first_text(STORED_WIDTH_PATH(descriptor_element)))
+        self.stored_height = int(first_text(STORED_HEIGHT_PATH(descriptor_element)))
+        self.picture_compression = first_text(PICTURE_COMPRESSION_PATH(descriptor_element))
+        self.container_format = first_text(CONTAINER_FORMAT_PATH(descriptor_element))
+        self.transfer_characteristic = first_text(TRANSFER_CHARACTERISTIC_PATH(descriptor_element))
+        self.coding_equations = first_text(CODING_EQUATIONS_PATH(descriptor_element))
+        self.color_primaries = first_text(COLOR_PRIMARIES_PATH(descriptor_element))
         self.fingerprint = fingerprint
         self.track_id = track_id
         self.duration = duration
@@ -70,7 +155,7 @@ class MainImageVirtualTrack:
             "fingerprint": self.fingerprint,
             "virtual_track_id": self.track_id,
             "resource_count": self.resource_count,
-            "duration": str(datetime.timedelta(milliseconds=int(self.duration * 1000)))[:-3],
+            "duration": milliseconds_to_str(int(self.duration * 1000)),
             "essence_info": {
                 "sample_rate": str(self.sample_rate),
                 "stored_width": self.stored_width,
@@ -87,6 +172,9 @@ class MainImageVirtualTrack:
 class MainAudioVirtualTrack:
     """Sound information"""
 
+    __slots__ = ("sample_rate", "spoken_language", "fingerprint", "track_id", "duration", "resource_count",
+                 "channels", "soundfield", "container_format", "channel_assignment")
+
     @property
     def kind(self) -> str:
         return "main_audio"
@@ -98,19 +186,16 @@ class MainAudioVirtualTrack:
 
     def __init__(self, descriptor_element: et.Element, fingerprint: str, track_id: str, duration: Fraction,
                  resource_count: int) -> None:
-        self.sample_rate = Fraction(descriptor_element.findtext(".//r1:SampleRate", namespaces=REGXML_NS))
-        self.spoken_language = descriptor_element.findtext(".//r1:RFC5646SpokenLanguage", namespaces=REGXML_NS)
+        self.sample_rate = parse_rate(first_text(SAMPLE_RATE_PATH(descriptor_element)) or "0")
+        self.spoken_language = first_text(SPOKEN_LANGUAGE_PATH(descriptor_element))
         self.fingerprint = fingerprint
         self.track_id = track_id
         self.duration = duration
         self.resource_count = resource_count
-        self.channels = [x.text for x in
-                         descriptor_element.findall(".//r0:AudioChannelLabelSubDescriptor/r1:MCATagSymbol",
-                                                    namespaces=REGXML_NS)]
-        self.soundfield = descriptor_element.findtext(".//r0:SoundfieldGroupLabelSubDescriptor/r1:MCATagSymbol",
-                                                      namespaces=REGXML_NS)
-        self.container_format = str(descriptor_element.findtext(".//r1:ContainerFormat", namespaces=REGXML_NS))
-        self.channel_assignment = str(descriptor_element.findtext(".//r1:ChannelAssignment", namespaces=REGXML_NS))
+        self.channels = [x.text for x in CHANNEL_SYMBOLS_PATH(descriptor_element)]
+        self.soundfield = first_text(SOUNDFIELD_SYMBOL_PATH(descriptor_element))
+        self.container_format = first_text(CONTAINER_FORMAT_PATH(descriptor_element))
+        self.channel_assignment = first_text(CHANNEL_ASSIGNMENT_PATH(descriptor_element))
 
     def to_dict(self) -> dict:
         return {
@@ -118,10 +203,10 @@ class MainAudioVirtualTrack:
             "fingerprint": self.fingerprint,
             "virtual_track_id": self.track_id,
             "resource_count": self.resource_count,
-            "duration": str(datetime.timedelta(milliseconds=int(self.duration * 1000)))[:-3],
+            "duration": milliseconds_to_str(int(self.duration * 1000)),
             "essence_info": {
                 "sample_rate": str(self.sample_rate),
-                "spoken_language": str(self.spoken_language),
+                "spoken_language": self.spoken_language,
                 "soundfield": self.soundfield,
                 "container_format": lookup_name(self.container_format),
                 "channel_assignment": lookup_name(self.channel_assignment),
@@ -133,24 +218,25 @@ class MainAudioVirtualTrack:
 class SubtitlesVirtualTrack:
     """Subtitle information"""
 
+    __slots__ = ("sample_rate", "subtitle_language", "fingerprint", "track_id", "duration", "resource_count",
+                 "container_format")
+
     @property
     def kind(self) -> str:
         return "main_subtitle"
 
     sample_rate: Fraction
-    channels: typing.List[str]
-    soundfield: str
     fingerprint: str
 
     def __init__(self, descriptor_element: et.Element, fingerprint: str, track_id: str, duration: Fraction,
                  resource_count: int) -> None:
-        self.sample_rate = Fraction(descriptor_element.findtext(".//r1:SampleRate", namespaces=REGXML_NS))
-        self.subtitle_language = descriptor_element.findtext(".//r2:RFC5646LanguageTagList", namespaces=REGXML_NS)
+        self.sample_rate = parse_rate(first_text(SAMPLE_RATE_PATH(descriptor_element)) or "0")
+        self.subtitle_language = first_text(LANGUAGE_TAG_LIST_PATH(descriptor_element))
         self.fingerprint = fingerprint
         self.track_id = track_id
         self.duration = duration
         self.resource_count = resource_count
-        self.container_format = str(descriptor_element.findtext(".//r1:ContainerFormat", namespaces=REGXML_NS))
+        self.container_format = first_text(CONTAINER_FORMAT_PATH(descriptor_element))
 
     def to_dict(self) -> dict:
         return {
@@ -158,17 +244,32 @@ class SubtitlesVirtualTrack:
             "fingerprint": self.fingerprint,
             "virtual_track_id": self.track_id,
             "resource_count": self.resource_count,
-            "duration": str(datetime.timedelta(milliseconds=int(self.duration * 1000)))[:-3],
+            "duration": milliseconds_to_str(int(self.duration * 1000)),
             "essence_info": {
                 "sample_rate": str(self.sample_rate),
-                "subtitle_language": str(self.subtitle_language),
+                "subtitle_language": self.subtitle_language,
                 "container_format": lookup_name(self.container_format)
             }
         }
 
 
+VIRTUAL_TRACK_CLASSES = {
+    "MainImageSequence": MainImageVirtualTrack,
+    "MainAudioSequence": MainAudioVirtualTrack,
+    "SubtitlesSequence": SubtitlesVirtualTrack
+}
+
+# Sequence element qualified names, in every compatible core namespace, mapped to their virtual track class
+VIRTUAL_TRACK_CLASSES_BY_TAG = {
+    f"{{{ns}}}{name}": vt_class for ns in COMPATIBLE_CORE_NS for name, vt_class in VIRTUAL_TRACK_CLASSES.items()
+}
+
+
 class CPLInfo:
     """CPL information"""
+
+    __slots__ = ("namespace", "content_title", "edit_rate", "virtual_tracks")
+
     namespace: str
     content_title: str
     edit_rate: Fraction
@@ -185,83 +286,100 @@ class CPLInfo:
 
         ns_dict = {"cpl": self.namespace}
 
+        ns_prefix = f"{{{self.namespace}}}"
+
         self.content_title = cpl_element.findtext(".//cpl:ContentTitle", namespaces=ns_dict)
 
         self.edit_rate = cpl_rational_to_fraction(cpl_element.findtext(".//cpl:EditRate", namespaces=ns_dict))
 
         self.virtual_tracks = []
 
+        descriptors_by_id = {}
+
+        for descriptor in cpl_element.iterfind(".//cpl:EssenceDescriptor", namespaces=ns_dict):
+            descriptors_by_id.setdefault(descriptor.findtext("cpl:Id", namespaces=ns_dict), descriptor)
+
+        resources_by_track_id = {}
+
+        for sequence in cpl_element.iterfind("./cpl:SegmentList/cpl:Segment/cpl:SequenceList/*", namespaces=ns_dict):
+            resources_by_track_id.setdefault(sequence.findtext("cpl:TrackId", namespaces=ns_dict), []).extend(
+                sequence.findall("./cpl:ResourceList/cpl:Resource", namespaces=ns_dict))
+
         sequence_list = cpl_element.find("./cpl:SegmentList/cpl:Segment/cpl:SequenceList", namespaces=ns_dict)
 
-        for sequence in sequence_list:
+        for sequence in sequence_list.findall("*"):
             track_id = sequence.findtext("cpl:TrackId", namespaces=ns_dict)
 
             if track_id is None:
                 LOGGER.error("Sequence is missing TrackId")
                 continue
 
-            sequence_ns, sequence_name = split_qname(sequence.tag)
+            vt_class = VIRTUAL_TRACK_CLASSES_BY_TAG.get(sequence.tag)
 
-            if sequence_ns not in COMPATIBLE_CORE_NS:
-                LOGGER.warning("Unknown virtual track namespace %s", sequence_ns)
-                continue
+            if vt_class is None:
+                sequence_ns, sequence_name = split_qname(sequence.tag)
 
-            if sequence_name == "MainImageSequence":
-                vt_class = MainImageVirtualTrack
-            elif sequence_name == "MainAudioSequence":
-                vt_class = MainAudioVirtualTrack
-            elif sequence_name == "SubtitlesSequence":
-                vt_class = SubtitlesVirtualTrack
-            else:
-                LOGGER.warning("Unknown Sequence kind: %s", sequence_name)
+                if sequence_ns not in COMPATIBLE_CORE_NS:
+                    LOGGER.warning("Unknown virtual track namespace %s", sequence_ns)
+                else:
+                    LOGGER.warning("Unknown Sequence kind: %s", sequence_name)
                 continue
 
-            source_encoding = sequence.findtext(".//cpl:SourceEncoding", namespaces=ns_dict)
+            resources = resources_by_track_id[track_id]
+
+            # all resources of a virtual track reference the same essence descriptor
+            source_encoding = resources[0].findtext("cpl:SourceEncoding", namespaces=ns_dict) if resources else None
 
             if source_encoding is None:
                 LOGGER.error("Cannot find source encoding descriptor")
                 continue
 
-            essence_descriptor = cpl_element.find(f".//cpl:EssenceDescriptor[cpl:Id='{source_encoding}']",
-                                                  namespaces=ns_dict)
+            essence_descriptor = descriptors_by_id.get(source_encoding)
 
             if essence_descriptor is None:
                 LOGGER.error("Cannot find essence descriptor")
                 continue
 
-            resources = cpl_element.findall(
-                f"./cpl:SegmentList/cpl:Segment/cpl:SequenceList/*[cpl:TrackId='{track_id}']/cpl:ResourceList/cpl:Resource",
-                namespaces=ns_dict)
+            fingerprint_data = []
 
-            fingerprint = hashlib.sha1()
-
-            total_duration = 0
+            duration_by_edit_rate = {}
 
             for resource in resources:
-                edit_rate = cpl_rational_to_fraction(
-                    resource.findtext(".//cpl:EditRate", namespaces=ns_dict)) or self.edit_rate
+                # read all Resource properties in a single pass over its children rather than one path search each
+                properties = {child.tag: child.text or "" for child in resource}
+
+                resource_edit_rate = properties.get(ns_prefix + "EditRate")
 
-                entry_point = edit_rate * int(resource.findtext(".//cpl:EntryPoint", namespaces=ns_dict) or 0)
+                edit_rate = cpl_rational_to_fraction(resource_edit_rate) if resource_edit_rate else self.edit_rate
+
+                entry_point = int(properties.get(ns_prefix + "EntryPoint") or 0)
 
                 resource_duration = int(
-                    resource.findtext(".//cpl:SourceDuration", namespaces=ns_dict) or resource.findtext(
-                        ".//cpl:IntrinsicDuration", namespaces=ns_dict)) / edit_rate
+                    properties.get(ns_prefix + "SourceDuration") or properties.get(ns_prefix + "IntrinsicDuration"))
 
                 if resource_duration == 0:
                     continue
-                total_duration += resource_duration
 
-                repeat_count = int(resource.findtext(".//cpl:RepeatCount", namespaces=ns_dict) or 1)
+                # durations are summed in edit units and converted to seconds once per edit rate
+                duration_by_edit_rate[edit_rate] = duration_by_edit_rate.get(edit_rate, 0) + resource_duration
+
+                repeat_count = int(properties.get(ns_prefix + "RepeatCount") or 1)
+
+                trackfile_id = properties.get(ns_prefix + "TrackFileId")
 
-                trackfile_id = resource.findtext(".//cpl:TrackFileId", namespaces=ns_dict)
+                fingerprint_data.append(
+                    rational_to_str(edit_rate.numerator * entry_point, edit_rate.denominator)
+                    + rational_to_str(resource_duration * edit_rate.denominator, edit_rate.numerator)
+                    + f"{repeat_count}{trackfile_id}")
 
-                fingerprint.update(bytes(str(entry_point), 'ascii'))
-                fingerprint.update(bytes(str(resource_duration), 'ascii'))
-                fingerprint.update(bytes(str(repeat_count), 'ascii'))
-                fingerprint.update(bytes(str(trackfile_id), 'ascii'))
+            total_duration = sum(duration / edit_rate for edit_rate, duration in duration_by_edit_rate.items())
+
+            # hash the whole track at once rather than issuing one small update per field; the fingerprint only
+            # identifies the track, so BLAKE2b is used with a 160-bit digest to keep the width of the former SHA-1
+            fingerprint = hashlib.blake2b("".join(fingerprint_data).encode("ascii"), digest_size=20).hexdigest()
 
             self.virtual_tracks.append(
-                vt_class(essence_descriptor, fingerprint.hexdigest(), track_id, total_duration, len(resources)))
+                vt_class(essence_descriptor, fingerprint, track_id, total_duration, len(resources)))
 
     def to_dict(self) -> dict:
         return {
@@ -270,6 +388,35 @@ class CPLInfo:
             "virtual_tracks": [vt.to_dict() for vt in self.virtual_tracks]
         }
 
+    def to_json_stream(self, fp: typing.TextIO, indent: typing.Union[str, int, None] = "  ") -> None:
+        """Writes the JSON representation of to_dict() to fp one virtual track at a time"""
+        if indent is None:
+            # compact output is a single line, so there is nothing to gain from streaming it
+            json.dump(self.to_dict(), fp)
+            return
+
+        # same interpretation as json.dumps(): an integer is a number of spaces
+        if not isinstance(indent, str):
+            indent = " " * indent
+
+        fp.write(f'{{\n{indent}"namespace": {json.dumps(self.namespace)},\n')
+        fp.write(f'{indent}"content_title": {json.dumps(self.content_title)},\n')
+
+        if not self.virtual_tracks:
+            fp.write(f'{indent}"virtual_tracks": []\n}}')
+            return
+
+        fp.write(f'{indent}"virtual_tracks": [')
+
+        separator = "\n"
+
+        for vt in self.virtual_tracks:
+            # each track is indented by two levels, which is safe since JSON strings never contain a raw newline
+            fp.write(separator + indent * 2 + json.dumps(vt.to_dict(), indent=indent).replace("\n", "\n" + indent * 2))
+            separator = ",\n"
+
+        fp.write(f"\n{indent}]\n}}")
+
 
 # New module functions
 
@@ -283,9 +430,8 @@ def parse_cpl_file(file_path: str) -> CPLInfo:
     Returns:
         CPLInfo object containing the parsed CPL information
     """
-    with open(file_path, 'r', encoding="UTF-8") as cpl_file:
-        cpl_doc = et.parse(cpl_file)
-        return CPLInfo(cpl_doc.getroot())
+    cpl_doc = et.parse(file_path)
+    return CPLInfo(cpl_doc.getroot())
 
 
 def parse_cpl_string(cpl_content: str) -> CPLInfo:
@@ -298,8 +444,7 @@ def parse_cpl_string(cpl_content: str) -> CPLInfo:
     Returns:
         CPLInfo object containing the parsed CPL information
     """
-    cpl_doc = et.parse(io.StringIO(cpl_content))
-    return CPLInfo(cpl_doc.getroot())
+    return CPLInfo(et.fromstring(cpl_content.encode("utf-8")))
 
 
 def parse_cpl_element(cpl_element: et.Element) -> CPLInfo:
@@ -325,7 +470,15 @@ def get_cpl_info_json(cpl_info: CPLInfo, indent: str = "  ") -> str:
 
     Returns:
         JSON string representation of the CPL information
+
+    Note:
+        When the optional orjson package is installed and the default indent is used, non-ASCII characters
+        (e.g. in the content title) are output as-is; otherwise they are output as \\uXXXX escapes, as with
+        json.dumps(). Both forms decode to the same JSON value.
     """
+    if orjson is not None and indent == "  ":
+        return orjson.dumps(cpl_info.to_dict(), option=orjson.OPT_INDENT_2).decode("utf-8")  # pylint: disable=no-member
+
     return json.dumps(cpl_info.to_dict(), indent=indent)
 
 
@@ -381,7 +534,8 @@ def get_subtitle_tracks(cpl_info: CPLInfo) -> typing.List[SubtitlesVirtualTrack]
     return [vt for vt in cpl_info.virtual_tracks if isinstance(vt, SubtitlesVirtualTrack)]
 
 
-def process_cpl_file_to_json(file_path: str, output_file: str = None, indent: str = "  ") -> str:
+def process_cpl_file_to_json(file_path: str, output_file: str = None,
+                             indent: typing.Union[str, int, None] = "  ") -> str:
     """
     Process a CPL file and convert it to JSON
 
@@ -392,15 +546,69 @@ def process_cpl_file_to_json(file_path: str, output_file: str = None, indent: st
 
     Returns:
         JSON string representation of the CPL information (if output_file is None)
+
+    Note:
+        Non-ASCII characters are output as-is or escaped depending on whether orjson is installed, as described
+        in get_cpl_info_json(). Output files are always UTF-8 encoded.
     """
     cpl_info = parse_cpl_file(file_path)
-    json_output = get_cpl_info_json(cpl_info, indent)
 
-    if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(json_output)
+    if not output_file:
+        return get_cpl_info_json(cpl_info, indent)
+
+    if orjson is not None and indent == "  ":
+        # orjson produces UTF-8 bytes, which are written without an intermediate string
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(cpl_info.to_dict(), option=orjson.OPT_INDENT_2))  # pylint: disable=no-member
     else:
-        return json_output
+        with open(output_file, 'w', encoding='utf-8') as f:
+            cpl_info.to_json_stream(f, indent)
+
+
+def process_cpl_files_to_json(file_paths: typing.List[str], output_dir: str,
+                              indent: typing.Union[str, int, None] = "  ", workers: int = None,
+                              use_threads: bool = False) -> typing.List[str]:
+    """
+    Process CPL files in parallel and write each one to a JSON file
+
+    Args:
+        file_paths: Paths to the CPL files
+        output_dir: Directory where the JSON outputs are written, each named after its CPL file
+            (e.g. CPL_1234.xml is written to CPL_1234.json)
+        indent: Indentation to use for JSON formatting (default: two spaces)
+        workers: Number of worker processes or threads (default: number of CPUs)
+        use_threads: Use threads instead of processes, which avoids process start-up costs
+
+    Returns:
+        List of paths to the JSON files, in the order of file_paths
+
+    Raises:
+        ValueError: if two CPL files would be written to the same JSON file (e.g. a/CPL.xml and b/CPL.xml)
+    """
+    workers = workers or os.cpu_count() or 1
+
+    output_files = [os.path.join(output_dir, os.path.splitext(os.path.basename(file_path))[0] + ".json")
+                    for file_path in file_paths]
+
+    # concurrent writes to the same output file would silently lose or corrupt results
+    file_paths_by_output = {}
+
+    for file_path, output_file in zip(file_paths, output_files):
+        conflicting_path = file_paths_by_output.get(os.path.normcase(output_file))
+
+        if conflicting_path is not None:
+            raise ValueError(f"{conflicting_path} and {file_path} would both be written to {output_file}")
+
+        file_paths_by_output[os.path.normcase(output_file)] = file_path
+
+    executor_class = concurrent.futures.ThreadPoolExecutor if use_threads else concurrent.futures.ProcessPoolExecutor
+
+    with executor_class(max_workers=workers) as executor:
+        # consume the results so that exceptions raised by workers are propagated
+        list(executor.map(process_cpl_file_to_json, file_paths, output_files, [indent] * len(file_paths),
+                          chunksize=max(1, len(file_paths) // (workers * 4))))
+
+    return output_files
 
 
 def get_cpl_summary(cpl_info: CPLInfo) -> dict:
@@ -413,23 +621,29 @@ def get_cpl_summary(cpl_info: CPLInfo) -> dict:
     Returns:
         Dictionary containing summary information about the CPL
     """
-    image_tracks = get_main_image_tracks(cpl_info)
-    audio_tracks = get_main_audio_tracks(cpl_info)
-    subtitle_tracks = get_subtitle_tracks(cpl_info)
+    # Count tracks by kind and find the longest duration in a single pass
+    image_count = audio_count = subtitle_count = 0
+    max_duration = 0
+
+    for vt in cpl_info.virtual_tracks:
+        if isinstance(vt, MainImageVirtualTrack):
+            image_count += 1
+        elif isinstance(vt, MainAudioVirtualTrack):
+            audio_count += 1
+        elif isinstance(vt, SubtitlesVirtualTrack):
+            subtitle_count += 1
 
-    # Find the longest duration among all tracks
-    all_durations = [vt.duration for vt in cpl_info.virtual_tracks]
-    max_duration = max(all_durations) if all_durations else 0
+        max_duration = max(max_duration, vt.duration)
 
     return {
         "content_title": cpl_info.content_title,
         "namespace": cpl_info.namespace,
         "edit_rate": str(cpl_info.edit_rate),
-        "duration": str(datetime.timedelta(milliseconds=int(max_duration * 1000)))[:-3],
+        "duration": milliseconds_to_str(int(max_duration * 1000)),
         "track_count": {
-            "image": len(image_tracks),
-            "audio": len(audio_tracks),
-            "subtitle": len(subtitle_tracks),
+            "image": image_count,
+            "audio": audio_count,
+            "subtitle": subtitle_count,
             "total": len(cpl_info.virtual_tracks)
         }
     }
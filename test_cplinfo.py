@@ -7,7 +7,10 @@ This script uses an existing CPL.xml file in the same directory.
 """
 
 import unittest
+import io
+import re
 import json
+import tempfile
 from pathlib import Path
 
 # Import the cplinfo module
@@ -180,6 +183,55 @@ class TestCPLInfo(unittest.TestCase):
             len(self.cpl_info.virtual_tracks)
         )
 
+    def test_fingerprint_format(self):
+        """Test that track fingerprints are 160-bit hexadecimal digests"""
+        for track in self.cpl_info.virtual_tracks:
+            self.assertRegex(track.fingerprint, r"^[0-9a-f]{40}$")
+
+        # BLAKE2b (160-bit) fingerprint of the main image track of CPL.xml
+        image_track = cplInfo.get_main_image_tracks(self.cpl_info)[0]
+        self.assertEqual(image_track.fingerprint, "8bb8f31b5970914b114a0180e0b7de7ae38b78a4")
+
+    def test_parse_from_string(self):
+        """Test that parsing from a string matches parsing from a file"""
+        with open("CPL.xml", "r", encoding="utf-8") as f:
+            cpl_info = cplInfo.parse_cpl_string(f.read())
+
+        self.assertEqual(cpl_info.to_dict(), self.cpl_info.to_dict())
+
+    def test_resource_without_edit_rate(self):
+        """Test that a Resource without EditRate uses the CPL edit rate"""
+        with open("CPL.xml", "r", encoding="utf-8") as f:
+            cpl_content = f.read()
+
+        # the first indented EditRate belongs to the first Resource of the main image sequence
+        resource_edit_rate = "              <EditRate>24000 1001</EditRate>\n"
+        self.assertIn(resource_edit_rate, cpl_content)
+        cpl_info = cplInfo.parse_cpl_string(cpl_content.replace(resource_edit_rate, "", 1))
+
+        self.assertEqual(
+            cplInfo.get_main_image_tracks(cpl_info)[0].duration,
+            cplInfo.get_main_image_tracks(self.cpl_info)[0].duration
+        )
+
+    def test_missing_descriptor_properties(self):
+        """Test that missing descriptor properties are reported as None"""
+        with open("CPL.xml", "r", encoding="utf-8") as f:
+            cpl_content = f.read()
+
+        cpl_content = re.sub(r"<r1:RFC5646SpokenLanguage>[^<]*</r1:RFC5646SpokenLanguage>", "", cpl_content)
+        cpl_content = re.sub(r"<r1:ChannelAssignment>[^<]*</r1:ChannelAssignment>", "", cpl_content)
+        cpl_info = cplInfo.parse_cpl_string(cpl_content)
+
+        audio_tracks = cplInfo.get_main_audio_tracks(cpl_info)
+        self.assertTrue(len(audio_tracks) > 0)
+
+        for track in audio_tracks:
+            self.assertIsNone(track.spoken_language)
+            self.assertIsNone(track.channel_assignment)
+            self.assertIsNone(track.to_dict()["essence_info"]["spoken_language"])
+            self.assertIsNone(track.to_dict()["essence_info"]["channel_assignment"])
+
     def test_to_dict_conversion(self):
         """Test conversion to dictionary"""
         cpl_dict = self.cpl_info.to_dict()
@@ -211,6 +263,59 @@ class TestCPLInfo(unittest.TestCase):
         except json.JSONDecodeError:
             self.fail("get_cpl_info_json did not produce valid JSON")
 
+    def test_batch_processing(self):
+        """Test that batch processing writes one JSON file per CPL"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            for use_threads in (False, True):
+                output_files = cplInfo.process_cpl_files_to_json(["CPL.xml"], output_dir, workers=2,
+                                                                 use_threads=use_threads)
+
+                self.assertEqual(len(output_files), 1)
+                self.assertEqual(Path(output_files[0]).name, "CPL.json")
+
+                with open(output_files[0], "r", encoding="utf-8") as f:
+                    self.assertEqual(json.load(f)["content_title"], self.cpl_info.content_title)
+
+    def test_batch_processing_duplicate_names(self):
+        """Test that batch processing rejects CPL files that would share an output file"""
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
+            file_paths = []
+
+            for package in ("a", "b"):
+                Path(input_dir, package).mkdir()
+                file_paths.append(str(Path(input_dir, package, "CPL.xml")))
+                Path(file_paths[-1]).write_bytes(Path("CPL.xml").read_bytes())
+
+            with self.assertRaises(ValueError):
+                cplInfo.process_cpl_files_to_json(file_paths, output_dir, use_threads=True)
+
+            self.assertEqual(list(Path(output_dir).iterdir()), [])
+
+    def test_duration_format(self):
+        """Test that durations are formatted as H:MM:SS.mmm"""
+        self.assertEqual(cplInfo.cplInfo.milliseconds_to_str(0), "0:00:00.000")
+        self.assertEqual(cplInfo.cplInfo.milliseconds_to_str(7158693), "1:59:18.693")
+        self.assertEqual(cplInfo.cplInfo.milliseconds_to_str(90000000), "25:00:00.000")
+
+    def test_json_stream(self):
+        """Test that streamed JSON matches the serialized dictionary"""
+        for indent in ("  ", "    ", 2, None):
+            stream = io.StringIO()
+            self.cpl_info.to_json_stream(stream, indent)
+
+            self.assertEqual(stream.getvalue(), json.dumps(self.cpl_info.to_dict(), indent=indent))
+
+    def test_json_file_indent(self):
+        """Test that JSON files can be written compact or with an integer indent"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_file = str(Path(output_dir, "cpl.json"))
+
+            for indent in (None, 2):
+                cplInfo.process_cpl_file_to_json("CPL.xml", output_file, indent=indent)
+
+                with open(output_file, "r", encoding="utf-8") as f:
+                    self.assertEqual(f.read(), json.dumps(self.cpl_info.to_dict(), indent=indent))
+
     def test_summary_generation(self):
         """Test summary generation"""
         summary = cplInfo.get_cpl_summary(self.cpl_info)